@@ -3,19 +3,34 @@ Pydantic AI agent for identifying Contrast applications from repositories.
 """
 
 import asyncio
-from typing import Optional
+import contextlib
+import hashlib
+import logging
+from typing import List, Optional, Tuple
+import httpx
 from pydantic_ai import Agent
+from pydantic_ai.models import Model
+from pydantic_ai.usage import UsageLimits
+from .cache import ResultCache, fingerprint_repository
 from .config import Config
+from .contrast_api import find_applications, preflight_contrast
 from .dependencies import AgentDependencies
-from .models import ApplicationMatch
+from .models import ApplicationMatch, UsageInfo
 from .providers import get_model
-from .mcp_tools import create_mcp_toolsets
+from .mcp_tools import create_mcp_toolsets, run_mcp_servers
+from .repository import read_contrast_app_name, read_project_name
+from .semantic_cache import SemanticCache
 
+logger = logging.getLogger(__name__)
 
-AGENT_INSTRUCTIONS = """
+
+# The prompts keep all static text first and the repository path last, so the
+# longest possible prefix is shared between runs and hits provider prompt
+# caches (explicit on Anthropic/Bedrock, implicit on OpenAI/Gemini).
+AGENT_INSTRUCTIONS_STATIC = """
 You are an expert at analyzing codebases and matching them to applications in Contrast Security.
 
-Your task: Identify which Contrast Application corresponds to the repository at {repo_path}.
+Your task: Identify which Contrast Application corresponds to the repository path given in the user message.
 
 Process:
 1. Explore the repository structure and read key files (package.json, pom.xml, build.gradle, README, etc.)
@@ -25,6 +40,8 @@ Process:
 5. If multiple candidates exist, use contrast_get_route_coverage to validate (compare extracted routes vs Contrast routes)
 6. Return the best match with confidence level
 
+Stop and return your answer as soon as you have a HIGH or MEDIUM confidence match. Do not keep exploring.
+
 Signals to consider:
 - Project name in package.json, pom.xml, or similar config files
 - Technology stack (Java/Maven, Node.js/npm, Python, etc.)
@@ -40,77 +57,266 @@ Confidence levels:
 Always explain your reasoning in detail.
 """
 
+USER_PROMPT_PREFIX = (
+    "Identify the Contrast application that corresponds to the repository "
+    "below. Analyze the repository structure and files, then search for "
+    "matching Contrast applications. Follow the system instructions strictly."
+    "\n\nRepository path: "
+)
 
-async def identify_application(
+# Hard caps on a single identification run. Successful runs take 2-4 model
+# requests; the caps only bound runaway loops.
+MAX_MODEL_REQUESTS = 5
+MAX_TOOL_CALLS = 8
+
+# Explicit prompt-cache breakpoints for providers that need them. The MCP tool
+# schemas are identical on every turn, so they are cached alongside the system
+# prompt. OpenAI and Gemini cache long prompt prefixes implicitly and need no
+# settings.
+PROMPT_CACHE_SETTINGS = {
+    "anthropic": {
+        "anthropic_cache_instructions": True,
+        "anthropic_cache_tool_definitions": True,
+    },
+    "bedrock": {
+        "bedrock_cache_instructions": True,
+        "bedrock_cache_tool_definitions": True,
+    },
+}
+
+
+def _build_model_settings(config: Config) -> dict:
+    """Build provider-specific model settings for the agent run."""
+    return dict(PROMPT_CACHE_SETTINGS.get(config.llm_provider.lower(), {}))
+
+
+def _result_cache_key(config: Config, repo_path: str) -> str:
+    """Build the result cache key for a repository, Contrast organization and model."""
+    parts = (
+        fingerprint_repository(repo_path),
+        # Application IDs are only valid within one organization
+        config.contrast_host_name,
+        config.contrast_org_id,
+        config.llm_provider.lower(),
+        config.bedrock_model_id or "",
+        config.azure_openai_deployment or "",
+        config.gemini_model or "",
+        hashlib.sha256(AGENT_INSTRUCTIONS_STATIC.encode()).hexdigest(),
+    )
+    return hashlib.sha256("\0".join(parts).encode()).hexdigest()
+
+
+async def _try_direct_config_match(
     config: Config,
     repo_path: str,
 ) -> Optional[ApplicationMatch]:
+    """
+    Match the repository without the agent using names declared in its files.
+
+    A name from contrast_security.yaml (application.name) that exactly matches
+    one Contrast application gives a HIGH confidence match; a package.json or
+    pom.xml project name gives MEDIUM.
+
+    Returns:
+        ApplicationMatch on an unambiguous exact match, None otherwise
+    """
+    declared = read_contrast_app_name(repo_path)
+    if declared is not None:
+        confidence = "HIGH"
+    else:
+        declared = read_project_name(repo_path)
+        confidence = "MEDIUM"
+    if declared is None:
+        return None
+
+    name, source = declared
+    try:
+        applications = await find_applications(config, name)
+    except (httpx.HTTPError, ValueError) as e:
+        logger.debug("Direct Contrast lookup failed: %s", e)
+        return None
+
+    exact = [
+        app for app in applications
+        if app.get("app_id") and str(app.get("name", "")).lower() == name.lower()
+    ]
+    if len(exact) != 1:
+        return None
+
+    app = exact[0]
+    return ApplicationMatch(
+        application_id=app["app_id"],
+        application_name=app["name"],
+        confidence=confidence,
+        reasoning=(
+            f"Application name '{name}' declared in {source} exactly matches "
+            f"a single Contrast application."
+        ),
+        metadata={
+            "language": app.get("language"),
+            "tags": app.get("tags", []),
+            "source": source,
+        },
+    )
+
+
+def _only_application_match(app: dict) -> ApplicationMatch:
+    """Build the match for an organization's only application."""
+    return ApplicationMatch(
+        application_id=app["app_id"],
+        application_name=app.get("name", ""),
+        confidence="MEDIUM",
+        reasoning=(
+            "This is the only application in the Contrast organization, so "
+            "it was selected without analyzing the repository."
+        ),
+        metadata={
+            "language": app.get("language"),
+            "tags": app.get("tags", []),
+            "source": "preflight",
+        },
+    )
+
+
+async def identify_application(
+    config: Config,
+    repo_path: str,
+    model: Optional[Model] = None,
+    toolsets: Optional[List] = None,
+) -> Tuple[Optional[ApplicationMatch], Optional[UsageInfo]]:
     """
     Identify which Contrast application corresponds to the repository.
 
     Args:
         config: Application configuration
         repo_path: Path to repository to analyze
+        model: Pre-built LLM model (default: created from config)
+        toolsets: Running MCP servers (default: started for this run)
 
     Returns:
-        ApplicationMatch if found, None if no match
+        Tuple of the ApplicationMatch (None if no match) and the LLM token
+        usage (None if the agent did not run)
 
     Raises:
         Exception: If agent execution fails
     """
-    # Create LLM model
-    model = get_model(config)
+    # Return a previous result if the repository is unchanged. Skipped in
+    # debug mode so that agent behaviour can be observed.
+    cache = semantic_cache = None
+    if config.cache_ttl > 0 and not config.debug_logging:
+        cache = ResultCache(config.cache_dir, ttl=config.cache_ttl)
+        cache_key = _result_cache_key(config, repo_path)
+        cached = cache.get(cache_key)
+        if cached is not None:
+            return cached, None
 
-    # Create MCP toolsets
-    toolsets = await create_mcp_toolsets(config, repo_path)
+        semantic_cache = SemanticCache(
+            config.cache_dir,
+            organization=(config.contrast_host_name, config.contrast_org_id),
+        )
 
-    # Create agent dependencies
-    deps = AgentDependencies(
-        repository_path=repo_path,
-        debug_mode=config.debug_logging,
-    )
+    def remember(match: ApplicationMatch) -> None:
+        if cache is not None:
+            cache.set(cache_key, match)
+        if semantic_cache is not None:
+            semantic_cache.set(repo_path, match)
 
-    # Create agent with instructions
-    agent = Agent(
-        model=model,
-        deps_type=AgentDependencies,
-        result_type=ApplicationMatch,
-        system_prompt=AGENT_INSTRUCTIONS.format(repo_path=repo_path),
-        toolsets=toolsets,
-        retries=2,
-    )
+    # Names declared in the repository often identify the app directly
+    match = await _try_direct_config_match(config, repo_path)
+    if match is not None:
+        remember(match)
+        return match, None
+
+    # Reuse a match found recently for another repository declaring the
+    # same Contrast application
+    if semantic_cache is not None:
+        cached = semantic_cache.get(repo_path)
+        if cached is not None:
+            return cached, None
 
-    # Run agent with timeout
+    # An organization with zero or one application needs no matching
     try:
-        result = await asyncio.wait_for(
-            agent.run(
-                user_prompt=(
-                    f"Identify the Contrast application that corresponds to "
-                    f"the repository at {repo_path}. Analyze the repository "
-                    f"structure and files, then search for matching Contrast "
-                    f"applications."
-                ),
-                deps=deps,
-            ),
-            timeout=config.agent_timeout,
-        )
+        applications = await preflight_contrast(config)
+    except (httpx.HTTPError, ValueError) as e:
+        logger.debug("Contrast preflight failed: %s", e)
+    else:
+        if not applications:
+            return None, None
+        if len(applications) == 1 and applications[0].get("app_id"):
+            return _only_application_match(applications[0]), None
 
-        if config.debug_logging:
-            import sys
-            print(f"Agent result: {result.data}", file=sys.stderr)
-            print(f"Agent usage: {result.usage()}", file=sys.stderr)
+    async with contextlib.AsyncExitStack() as stack:
+        # Create the LLM model in a worker thread while the MCP servers start,
+        # so provider SDK setup (e.g. the boto3 credential chain) overlaps
+        # with npx/docker startup
+        model_task = None
+        if model is None:
+            model_task = asyncio.ensure_future(asyncio.to_thread(get_model, config))
+        try:
+            if toolsets is None:
+                toolsets = await stack.enter_async_context(
+                    run_mcp_servers(await create_mcp_toolsets(config, repo_path))
+                )
+            if model_task is not None:
+                model = await model_task
+        except BaseException:
+            if model_task is not None:
+                model_task.cancel()
+            raise
 
-        return result.data
+        # Create agent dependencies
+        deps = AgentDependencies(
+            repository_path=repo_path,
+            debug_mode=config.debug_logging,
+        )
 
-    except asyncio.TimeoutError:
-        raise TimeoutError(
-            f"Agent timed out after {config.agent_timeout}s. "
-            f"Consider increasing AGENT_TIMEOUT."
+        # Create agent with instructions
+        agent = Agent(
+            model=model,
+            deps_type=AgentDependencies,
+            output_type=ApplicationMatch,
+            system_prompt=AGENT_INSTRUCTIONS_STATIC,
+            toolsets=toolsets,
+            model_settings=_build_model_settings(config),
+            retries=2,
         )
-    except Exception as e:
-        if config.debug_logging:
-            import sys
-            import traceback
-            print(f"Agent error: {e}", file=sys.stderr)
-            traceback.print_exc(file=sys.stderr)
-        raise
+
+        # Run agent with timeout
+        try:
+            result = await asyncio.wait_for(
+                agent.run(
+                    user_prompt=f"{USER_PROMPT_PREFIX}{repo_path}",
+                    deps=deps,
+                    usage_limits=UsageLimits(
+                        request_limit=MAX_MODEL_REQUESTS,
+                        tool_calls_limit=MAX_TOOL_CALLS,
+                    ),
+                ),
+                timeout=config.agent_timeout,
+            )
+
+            run_usage = result.usage()
+            logger.debug("Agent result: %s", result.output)
+            logger.debug("Agent usage: %s", run_usage)
+
+            usage = UsageInfo(
+                input_tokens=run_usage.input_tokens,
+                output_tokens=run_usage.output_tokens,
+                cache_read_tokens=run_usage.cache_read_tokens,
+                cache_creation_tokens=run_usage.cache_write_tokens,
+            )
+
+            match = result.output
+            if match is not None:
+                remember(match)
+
+            return match, usage
+
+        except asyncio.TimeoutError:
+            raise TimeoutError(
+                f"Agent timed out after {config.agent_timeout}s. "
+                f"Consider increasing AGENT_TIMEOUT."
+            )
+        except Exception as e:
+            logger.debug("Agent error: %s", e, exc_info=True)
+            raise
@@ -0,0 +1,106 @@
+"""
+On-disk cache of identification results.
+"""
+
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from typing import Optional
+
+from .models import ApplicationMatch
+
+
+# Files whose presence, size and modification time identify the state of a
+# repository for caching purposes.
+FINGERPRINT_FILES = (
+    "contrast_security.yaml",
+    "contrast.yaml",
+    "pom.xml",
+    "package.json",
+    "pyproject.toml",
+)
+
+
+def fingerprint_repository(repo_path: str) -> str:
+    """
+    Compute a fingerprint of the repository's identifying files.
+
+    Args:
+        repo_path: Path to repository
+
+    Returns:
+        SHA256 hex digest over the repository path and the
+        (name, mtime, size) of each fingerprint file present
+    """
+    root = Path(repo_path).resolve()
+    digest = hashlib.sha256(str(root).encode())
+
+    for name in FINGERPRINT_FILES:
+        try:
+            stat = (root / name).stat()
+        except OSError:
+            continue
+        digest.update(f"\0{name}:{stat.st_mtime_ns}:{stat.st_size}".encode())
+
+    return digest.hexdigest()
+
+
+class ResultCache:
+    """JSON-file cache of ApplicationMatch results with TTL and LRU eviction."""
+
+    def __init__(self, directory: str, ttl: int, max_entries: int = 1000):
+        """
+        Args:
+            directory: Cache directory (created on first write)
+            ttl: Entry lifetime in seconds
+            max_entries: Entries kept before least recently used are evicted
+        """
+        self.directory = Path(directory).expanduser()
+        self.ttl = ttl
+        self.max_entries = max_entries
+
+    def _entry_path(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
+
+    def get(self, key: str) -> Optional[ApplicationMatch]:
+        """Return the cached match for key, or None on miss or expiry."""
+        path = self._entry_path(key)
+        try:
+            entry = json.loads(path.read_text())
+            if entry["expires_at"] < time.time():
+                path.unlink(missing_ok=True)
+                return None
+            match = ApplicationMatch.model_validate(entry["match"])
+            # Refresh access time for LRU eviction
+            os.utime(path)
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        return match
+
+    def set(self, key: str, match: ApplicationMatch) -> None:
+        """Store match under key. Cache write failures are ignored."""
+        entry = {
+            "expires_at": time.time() + self.ttl,
+            "match": match.model_dump(mode="json"),
+        }
+        path = self._entry_path(key)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_text(json.dumps(entry))
+            os.replace(tmp_path, path)
+            self._evict()
+        except OSError:
+            tmp_path.unlink(missing_ok=True)
+
+    def _evict(self) -> None:
+        """Remove least recently used entries beyond max_entries."""
+        entries = list(self.directory.glob("*.json"))
+        if len(entries) <= self.max_entries:
+            return
+
+        entries.sort(key=lambda p: p.stat().st_mtime)
+        for path in entries[: len(entries) - self.max_entries]:
+            path.unlink(missing_ok=True)
@@ -2,8 +2,11 @@
 Configuration loading from environment variables.
 """
 
+import functools
+import logging
 import os
-from typing import Optional
+from types import MappingProxyType
+from typing import Mapping, Optional
 from dotenv import load_dotenv
 
 # Load .env file if present
@@ -20,6 +23,7 @@ class Config:
     aws_region: Optional[str] = None
     aws_access_key_id: Optional[str] = None
     aws_secret_access_key: Optional[str] = None
+    aws_session_token: Optional[str] = None
     bedrock_model_id: Optional[str] = None
 
     # Azure OpenAI
@@ -44,6 +48,8 @@ class Config:
     # Optional
     agent_timeout: int = 300
     debug_logging: bool = False
+    cache_dir: str = "~/.cache/app-identifier"
+    cache_ttl: int = 86400
 
     def __init__(self):
         """Load configuration from environment variables."""
@@ -54,6 +60,7 @@ class Config:
         self.aws_region = os.getenv("AWS_REGION")
         self.aws_access_key_id = os.getenv("AWS_ACCESS_KEY_ID")
         self.aws_secret_access_key = os.getenv("AWS_SECRET_ACCESS_KEY")
+        self.aws_session_token = os.getenv("AWS_SESSION_TOKEN")
         self.bedrock_model_id = os.getenv(
             "BEDROCK_MODEL_ID",
             "anthropic.claude-sonnet-4-5-20250929-v1:0"
@@ -81,6 +88,11 @@ class Config:
         # Optional
         self.agent_timeout = int(os.getenv("AGENT_TIMEOUT", "300"))
         self.debug_logging = os.getenv("DEBUG_LOGGING", "false").lower() == "true"
+        logging.getLogger("app_identifier").setLevel(
+            logging.DEBUG if self.debug_logging else logging.WARNING
+        )
+        self.cache_dir = os.getenv("CACHE_DIR", "~/.cache/app-identifier")
+        self.cache_ttl = int(os.getenv("CACHE_TTL", "86400"))
 
         # Validate provider-specific config
         self._validate_provider_config()
@@ -130,3 +142,8 @@ class Config:
             "CONTRAST_USERNAME": self.contrast_username,
             "CONTRAST_ORG_ID": self.contrast_org_id,
         }
+
+    @functools.cached_property
+    def contrast_env_subprocess(self) -> Mapping[str, str]:
+        """Get the Contrast MCP server environment, computed once per Config."""
+        return MappingProxyType({**os.environ, **self.get_contrast_env()})
@@ -0,0 +1,119 @@
+"""
+Minimal Contrast REST API client for lookups that don't need the agent.
+"""
+
+import base64
+import time
+from typing import Dict, List, Tuple
+
+import httpx
+
+from .config import Config
+
+
+# Timeout for direct API calls, in seconds
+REQUEST_TIMEOUT = 10.0
+
+# How long preflight results are reused, in seconds
+PREFLIGHT_TTL = 60.0
+
+# Preflight results by (host, org ID): (monotonic timestamp, applications)
+_preflight_cache: Dict[Tuple[str, str], Tuple[float, List[dict]]] = {}
+
+
+def _base_url(config: Config) -> str:
+    """Build the organization API base URL."""
+    host = config.contrast_host_name.rstrip("/")
+    if not host.startswith(("http://", "https://")):
+        host = f"https://{host}"
+    return f"{host}/Contrast/api/ng/{config.contrast_org_id}"
+
+
+def _headers(config: Config) -> dict:
+    """Build Contrast API authentication headers."""
+    token = base64.b64encode(
+        f"{config.contrast_username}:{config.contrast_service_key}".encode()
+    ).decode()
+    return {
+        "API-Key": config.contrast_api_key,
+        "Authorization": token,
+        "Accept": "application/json",
+    }
+
+
+def _parse_applications(response: httpx.Response) -> List[dict]:
+    """
+    Extract application records from a Contrast API response.
+
+    Raises:
+        ValueError: If the body is not a successful application listing
+    """
+    body = response.json()
+    if (
+        not isinstance(body, dict)
+        or body.get("success") is False
+        or not isinstance(body.get("applications"), list)
+    ):
+        raise ValueError(f"Unexpected Contrast API response from {response.url.path}")
+
+    return [app for app in body["applications"] if isinstance(app, dict)]
+
+
+async def find_applications(config: Config, name: str) -> List[dict]:
+    """
+    Search Contrast applications by name.
+
+    Args:
+        config: Application configuration
+        name: Text to filter application names by
+
+    Returns:
+        Application records returned by the Contrast API
+
+    Raises:
+        httpx.HTTPError: If the request fails
+        ValueError: If the response is not an application listing
+    """
+    async with httpx.AsyncClient(timeout=REQUEST_TIMEOUT) as client:
+        response = await client.get(
+            f"{_base_url(config)}/applications/filter",
+            params={"filterText": name},
+            headers=_headers(config),
+        )
+        response.raise_for_status()
+        return _parse_applications(response)
+
+
+async def preflight_contrast(config: Config) -> List[dict]:
+    """
+    List at most two applications in the organization.
+
+    Enough to tell whether the organization has zero, one or several
+    applications. Results are cached for PREFLIGHT_TTL seconds.
+
+    Args:
+        config: Application configuration
+
+    Returns:
+        Up to two application records
+
+    Raises:
+        httpx.HTTPError: If the request fails
+        ValueError: If the response is not an application listing
+    """
+    key = (config.contrast_host_name, config.contrast_org_id)
+    cached = _preflight_cache.get(key)
+    if cached is not None and time.monotonic() - cached[0] < PREFLIGHT_TTL:
+        return cached[1]
+
+    async with httpx.AsyncClient(timeout=REQUEST_TIMEOUT) as client:
+        response = await client.get(
+            f"{_base_url(config)}/applications",
+            params={"limit": 2},
+            headers=_headers(config),
+        )
+        response.raise_for_status()
+        applications = _parse_applications(response)[:2]
+
+    _preflight_cache[key] = (time.monotonic(), applications)
+    return applications
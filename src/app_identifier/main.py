@@ -5,6 +5,7 @@ CLI entry point for Contrast Application Identifier.
 
 import asyncio
 import json
+import logging
 import os
 import sys
 import time
@@ -17,6 +18,8 @@ from .agent import identify_application
 from .config import Config
 from .models import IdentificationResult
 
+logger = logging.getLogger(__name__)
+
 
 @click.command()
 @click.argument(
@@ -62,6 +65,9 @@ def main(
     if debug:
         os.environ["DEBUG_LOGGING"] = "true"
 
+    # Debug output goes to stderr, leaving stdout for the JSON result
+    logging.basicConfig(stream=sys.stderr, format="%(message)s")
+
     # Load configuration
     try:
         config = Config()
@@ -71,7 +77,7 @@ def main(
 
     # Run identification
     start_time = time.time()
-    result = asyncio.run(_run_identification(config, repo_path))
+    result, usage = asyncio.run(_run_identification(config, repo_path))
     execution_time_ms = (time.time() - start_time) * 1000
 
     # Build result object
@@ -81,10 +87,13 @@ def main(
         match=result,
         error=None if result else "No matching Contrast application found",
         execution_time_ms=execution_time_ms,
+        usage=usage,
     )
 
-    # Output JSON
-    json_output = result_obj.model_dump_json(indent=2)
+    # Output JSON, pretty-printed only for a terminal. Files and pipes get
+    # compact output, which is cheaper to produce in batch runs.
+    indent = 2 if sys.stdout.isatty() and not output else None
+    json_output = result_obj.model_dump_json(indent=indent)
 
     if output:
         Path(output).write_text(json_output)
@@ -102,19 +111,17 @@ async def _run_identification(config: Config, repo_path: str):
     Run agent identification with error handling.
 
     Returns:
-        ApplicationMatch if found, None otherwise
+        Tuple of ApplicationMatch (None if not found) and token usage
     """
     try:
         return await identify_application(config, repo_path)
     except TimeoutError as e:
         click.echo(f"Error: {e}", err=True)
-        return None
+        return None, None
     except Exception as e:
         click.echo(f"Error during identification: {e}", err=True)
-        if config.debug_logging:
-            import traceback
-            traceback.print_exc(file=sys.stderr)
-        return None
+        logger.debug("Identification traceback:", exc_info=True)
+        return None, None
 
 
 if __name__ == "__main__":
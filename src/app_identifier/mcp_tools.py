@@ -3,10 +3,14 @@ MCP toolset setup for filesystem and Contrast server integration.
 """
 
 import asyncio
-import os
-from typing import List
+import contextlib
+import logging
+from typing import AsyncIterator, List
+from pydantic_ai.mcp import MCPServerStdio
 from .config import Config
 
+logger = logging.getLogger(__name__)
+
 
 async def create_mcp_toolsets(config: Config, repo_path: str) -> List:
     """
@@ -22,8 +26,6 @@ async def create_mcp_toolsets(config: Config, repo_path: str) -> List:
     Raises:
         Exception: If MCP server connection fails
     """
-    from pydantic_ai.mcp import MCPServerStdio
-
     toolsets = []
 
     # Filesystem MCP Server
@@ -41,7 +43,6 @@ async def create_mcp_toolsets(config: Config, repo_path: str) -> List:
     toolsets.append(fs_server)
 
     # Contrast MCP Server (via Docker)
-    contrast_env = config.get_contrast_env()
     contrast_args = [
         "run", "-i", "--rm",
         "-e", "CONTRAST_HOST_NAME",
@@ -53,20 +54,70 @@ async def create_mcp_toolsets(config: Config, repo_path: str) -> List:
         "-t", "stdio"
     ]
 
-    # Set environment for subprocess
-    env = os.environ.copy()
-    env.update(contrast_env)
-
     contrast_server = MCPServerStdio(
         command="docker",
         args=contrast_args,
-        env=env,
+        env=config.contrast_env_subprocess,
         tool_prefix="contrast_",
     )
     toolsets.append(contrast_server)
 
-    if config.debug_logging:
-        import sys
-        print("MCP servers created successfully", file=sys.stderr)
+    logger.debug("MCP servers created successfully")
 
     return toolsets
+
+
+async def _serve(server: MCPServerStdio, started: asyncio.Future, stop: asyncio.Event) -> None:
+    """Run server until stop is set, reporting startup through started."""
+    try:
+        async with server:
+            started.set_result(None)
+            await stop.wait()
+    except Exception as e:
+        if started.done():
+            raise
+        started.set_exception(e)
+
+
+@contextlib.asynccontextmanager
+async def run_mcp_servers(servers: List[MCPServerStdio]) -> AsyncIterator[List[MCPServerStdio]]:
+    """
+    Keep MCP servers running for the duration of the block.
+
+    The servers are started concurrently, so startup takes max(npx, docker)
+    rather than their sum. Each server runs in its own owner task because the
+    MCP client must be entered and exited from the same task; agents entering
+    a running server only increment its reference count.
+
+    Args:
+        servers: MCP servers to run
+
+    Yields:
+        The running servers
+
+    Raises:
+        Exception: If a server fails to start
+    """
+    loop = asyncio.get_running_loop()
+    stop = asyncio.Event()
+    started = [loop.create_future() for _ in servers]
+    tasks = [
+        asyncio.create_task(_serve(server, future, stop))
+        for server, future in zip(servers, started)
+    ]
+
+    try:
+        if started:
+            done, _ = await asyncio.wait(started, return_when=asyncio.FIRST_EXCEPTION)
+            for future in done:
+                future.result()
+
+        logger.debug("MCP servers ready")
+        yield servers
+    finally:
+        stop.set()
+        # Servers still starting have nothing to clean up yet
+        for task, future in zip(tasks, started):
+            if not future.done():
+                task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
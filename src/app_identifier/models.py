@@ -22,6 +22,15 @@ class ApplicationMatch(BaseModel):
     )
 
 
+class UsageInfo(BaseModel):
+    """LLM token usage for an identification run."""
+
+    input_tokens: int
+    output_tokens: int
+    cache_read_tokens: int = 0
+    cache_creation_tokens: int = 0
+
+
 class IdentificationResult(BaseModel):
     """Top-level result structure."""
 
@@ -30,3 +39,4 @@ class IdentificationResult(BaseModel):
     match: Optional[ApplicationMatch] = None
     error: Optional[str] = None
     execution_time_ms: float
+    usage: Optional[UsageInfo] = None
@@ -2,12 +2,17 @@
 LLM provider factory for multi-provider support.
 """
 
-from typing import Any
-from pydantic_ai.models import Model
+import sys
+import threading
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional
 from .config import Config
 
+if TYPE_CHECKING:
+    from pydantic_ai.models import Model
 
-def get_model(config: Config) -> Model:
+
+def get_model(config: Config) -> "Model":
     """
     Factory function to create LLM model based on configuration.
 
@@ -20,69 +25,155 @@ def get_model(config: Config) -> Model:
     Raises:
         ValueError: If provider is unknown or credentials are missing
     """
-    provider = config.llm_provider.lower()
-
-    if provider == "bedrock":
-        return _create_bedrock_model(config)
-    elif provider == "azure":
-        return _create_azure_model(config)
-    elif provider == "anthropic":
-        return _create_anthropic_model(config)
-    elif provider == "gemini":
-        return _create_gemini_model(config)
-    else:
+    # Interned so the _PROVIDERS lookup matches its literal keys by identity
+    provider = sys.intern(config.llm_provider.lower())
+    factory = _PROVIDERS.get(provider)
+
+    if factory is None:
         raise ValueError(
             f"Unknown provider: {provider}. "
             f"Valid options: bedrock, azure, anthropic, gemini"
         )
 
+    return factory(config)
 
-def _create_bedrock_model(config: Config) -> Model:
+
+def _create_bedrock_model(config: Config) -> "Model":
     """Create AWS Bedrock model."""
-    from pydantic_ai.models.bedrock import BedrockConverseModel
-    import os
+    return _bedrock_model(
+        config.bedrock_model_id,
+        config.aws_region,
+        config.aws_access_key_id,
+        config.aws_secret_access_key,
+        config.aws_session_token,
+    )
+
+
+def _create_azure_model(config: Config) -> "Model":
+    """Create Azure OpenAI model."""
+    return _azure_model(
+        config.azure_openai_deployment,
+        config.azure_openai_endpoint,
+        config.azure_openai_api_key,
+    )
 
-    # Set AWS credentials and region in environment
-    if config.aws_access_key_id:
-        os.environ["AWS_ACCESS_KEY_ID"] = config.aws_access_key_id
-    if config.aws_secret_access_key:
-        os.environ["AWS_SECRET_ACCESS_KEY"] = config.aws_secret_access_key
-    if config.aws_region:
-        os.environ["AWS_DEFAULT_REGION"] = config.aws_region
 
-    # Return model instance
+def _create_anthropic_model(config: Config) -> "Model":
+    """Create Anthropic model."""
+    return _anthropic_model(config.anthropic_api_key)
+
+
+def _create_gemini_model(config: Config) -> "Model":
+    """Create Google Gemini model."""
+    return _gemini_model(config.gemini_model, config.google_api_key)
+
+
+# Model construction is cached on the settings that define it, so repeated
+# identifications with the same configuration reuse the SDK client.
+
+
+@lru_cache(maxsize=8)
+def _bedrock_model(
+    model_id: str,
+    region: Optional[str],
+    access_key_id: Optional[str],
+    secret_access_key: Optional[str],
+    session_token: Optional[str],
+) -> "Model":
+    """Build a Bedrock model, cached per model ID, region and credentials."""
+    from pydantic_ai.models.bedrock import BedrockConverseModel
+    from pydantic_ai.providers.bedrock import BedrockProvider
+
+    client = _get_bedrock_client(region, access_key_id, secret_access_key, session_token)
     return BedrockConverseModel(
-        model_name=config.bedrock_model_id,
+        model_name=model_id,
+        provider=BedrockProvider(bedrock_client=client),
     )
 
 
-def _create_azure_model(config: Config) -> Model:
-    """Create Azure OpenAI model."""
+# boto3 is imported on first Bedrock use only, and one Session is shared so
+# botocore's service models are loaded once rather than per client. Sessions
+# are not thread-safe and get_model runs in worker threads, so the session is
+# only used under _boto3_lock.
+_boto3: Any = None
+_boto3_session: Any = None
+_boto3_lock = threading.Lock()
+
+
+def _get_boto3() -> Any:
+    """Import boto3 once and return the module."""
+    global _boto3
+    if _boto3 is None:
+        import boto3
+
+        _boto3 = boto3
+    return _boto3
+
+
+def _get_bedrock_client(
+    region: Optional[str],
+    access_key_id: Optional[str],
+    secret_access_key: Optional[str],
+    session_token: Optional[str],
+) -> Any:
+    """Create a Bedrock Runtime client from the shared boto3 Session."""
+    global _boto3_session
+    boto3 = _get_boto3()
+
+    with _boto3_lock:
+        if _boto3_session is None:
+            _boto3_session = boto3.Session()
+
+        return _boto3_session.client(
+            "bedrock-runtime",
+            region_name=region,
+            aws_access_key_id=access_key_id,
+            aws_secret_access_key=secret_access_key,
+            aws_session_token=session_token,
+            # Match pydantic-ai's defaults; model responses can take minutes
+            config=boto3.session.Config(read_timeout=300, connect_timeout=60),
+        )
+
+
+@lru_cache(maxsize=8)
+def _azure_model(deployment: str, endpoint: str, api_key: str) -> "Model":
+    """Build an Azure OpenAI model, cached per deployment and credentials."""
     from pydantic_ai.models.openai import OpenAIModel
 
     # Azure OpenAI uses OpenAI SDK with azure endpoint
     return OpenAIModel(
-        model_name=config.azure_openai_deployment,
-        base_url=config.azure_openai_endpoint,
-        api_key=config.azure_openai_api_key,
+        model_name=deployment,
+        base_url=endpoint,
+        api_key=api_key,
     )
 
 
-def _create_anthropic_model(config: Config) -> Model:
-    """Create Anthropic model."""
+@lru_cache(maxsize=8)
+def _anthropic_model(api_key: str) -> "Model":
+    """Build an Anthropic model, cached per API key."""
     from pydantic_ai.models.anthropic import AnthropicModel
 
     return AnthropicModel(
         model_name="claude-sonnet-4-5",  # or configurable
-        api_key=config.anthropic_api_key,
+        api_key=api_key,
     )
 
 
-def _create_gemini_model(config: Config) -> Model:
-    """Create Google Gemini model."""
+@lru_cache(maxsize=8)
+def _gemini_model(model_name: str, api_key: str) -> "Model":
+    """Build a Gemini model, cached per model name and API key."""
     from pydantic_ai.models.gemini import GeminiModel
 
     return GeminiModel(
-        model_name=config.gemini_model,
-        api_key=config.google_api_key,
+        model_name=model_name,
+        api_key=api_key,
     )
+
+
+# Provider name -> model factory
+_PROVIDERS: Dict[str, Callable[[Config], "Model"]] = {
+    "bedrock": _create_bedrock_model,
+    "azure": _create_azure_model,
+    "anthropic": _create_anthropic_model,
+    "gemini": _create_gemini_model,
+}
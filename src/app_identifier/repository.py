@@ -0,0 +1,93 @@
+"""
+Direct extraction of project identifiers from repository files.
+"""
+
+import json
+import xml.etree.ElementTree as ET
+from pathlib import Path
+from typing import Optional, Tuple
+
+import yaml
+
+
+CONTRAST_CONFIG_FILES = ("contrast_security.yaml", "contrast.yaml")
+
+# Build files that identify a repository's primary language, in priority order
+LANGUAGE_MARKERS = (
+    ("pom.xml", "Java"),
+    ("build.gradle", "Java"),
+    ("build.gradle.kts", "Java"),
+    ("package.json", "Node"),
+    ("pyproject.toml", "Python"),
+    ("setup.py", "Python"),
+    ("requirements.txt", "Python"),
+    ("go.mod", "Go"),
+    ("Gemfile", "Ruby"),
+    ("composer.json", "PHP"),
+)
+
+
+def read_contrast_app_name(repo_path: str) -> Optional[Tuple[str, str]]:
+    """
+    Read application.name from the repository's Contrast agent config.
+
+    Returns:
+        (application name, config file name), or None if not declared
+    """
+    for filename in CONTRAST_CONFIG_FILES:
+        path = Path(repo_path) / filename
+        try:
+            data = yaml.safe_load(path.read_text())
+        except (OSError, ValueError, yaml.YAMLError):
+            continue
+
+        application = data.get("application") if isinstance(data, dict) else None
+        name = application.get("name") if isinstance(application, dict) else None
+        if isinstance(name, str) and name.strip():
+            return name.strip(), filename
+
+    return None
+
+
+def read_project_name(repo_path: str) -> Optional[Tuple[str, str]]:
+    """
+    Read the project name from package.json or pom.xml.
+
+    Returns:
+        (project name, manifest file name), or None if not found
+    """
+    root = Path(repo_path)
+
+    try:
+        package = json.loads((root / "package.json").read_text())
+    except (OSError, ValueError):
+        package = None
+    if isinstance(package, dict) and isinstance(package.get("name"), str):
+        return package["name"], "package.json"
+
+    try:
+        pom = ET.parse(root / "pom.xml").getroot()
+    except (OSError, ET.ParseError):
+        return None
+
+    # Maven POMs are namespaced; the project's own artifactId is a direct child
+    namespace = pom.tag[: pom.tag.index("}") + 1] if pom.tag.startswith("{") else ""
+    artifact_id = pom.findtext(f"{namespace}artifactId")
+    if artifact_id and artifact_id.strip():
+        return artifact_id.strip(), "pom.xml"
+
+    return None
+
+
+def detect_language(repo_path: str) -> Optional[str]:
+    """Detect the repository's primary language from its build files."""
+    root = Path(repo_path)
+
+    for filename, language in LANGUAGE_MARKERS:
+        if (root / filename).is_file():
+            return language
+
+    if any(root.glob("*.csproj")) or any(root.glob("*.sln")):
+        return ".NET"
+
+    return None
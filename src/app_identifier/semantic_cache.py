@@ -0,0 +1,73 @@
+"""
+Cache of identification results shared between repositories of the same
+application.
+"""
+
+import hashlib
+from pathlib import Path
+from typing import Optional, Tuple
+
+from .cache import ResultCache
+from .models import ApplicationMatch
+from .repository import detect_language, read_contrast_app_name
+
+
+# Identity entries are shared across repositories, so they expire sooner
+# than exact-repository entries
+SEMANTIC_CACHE_TTL = 6 * 60 * 60
+
+# Only confident matches are reused for other repositories
+SHAREABLE_CONFIDENCE = frozenset({"HIGH", "MEDIUM"})
+
+
+def repository_identity(repo_path: str) -> Optional[Tuple[str, str]]:
+    """
+    Extract the identity of the application a repository belongs to.
+
+    Only names declared in the repository's Contrast agent config count;
+    manifest names such as "api" or "frontend" are too generic to share.
+
+    Returns:
+        (application name, primary language), or None if the repository
+        declares no Contrast application name
+    """
+    declared = read_contrast_app_name(repo_path)
+    if declared is None:
+        return None
+
+    return declared[0].lower(), detect_language(repo_path) or ""
+
+
+class SemanticCache:
+    """Result cache keyed by repository identity rather than repository path."""
+
+    def __init__(self, directory: str, organization: Tuple[str, str], ttl: int = SEMANTIC_CACHE_TTL):
+        """
+        Args:
+            directory: Base cache directory; entries go in an identity/ subdirectory
+            organization: (Contrast host, org ID) the cached application IDs belong to
+            ttl: Entry lifetime in seconds
+        """
+        self._cache = ResultCache(str(Path(directory).expanduser() / "identity"), ttl=ttl)
+        self.organization = organization
+
+    def _key(self, identity: Tuple[str, str]) -> str:
+        return hashlib.sha256("\0".join(self.organization + identity).encode()).hexdigest()
+
+    def get(self, repo_path: str) -> Optional[ApplicationMatch]:
+        """Return the match cached for a repository with the same identity."""
+        identity = repository_identity(repo_path)
+        if identity is None:
+            return None
+        return self._cache.get(self._key(identity))
+
+    def set(self, repo_path: str, match: ApplicationMatch) -> None:
+        """Share a confident match with repositories of the same identity."""
+        identity = repository_identity(repo_path)
+        if identity is None or match.confidence.upper() not in SHAREABLE_CONFIDENCE:
+            return
+
+        shared = match.model_copy(update={
+            "reasoning": f"Cached from a prior run of repository {repo_path}. {match.reasoning}",
+        })
+        self._cache.set(self._key(identity), shared)
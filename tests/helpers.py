@@ -0,0 +1,11 @@
+"""Shared helpers for the test suite."""
+
+import pytest
+
+
+def skip_if_missing_dep(exc: Exception, deps=("docker", "npx")) -> None:
+    """Skip the current test if exc reports a missing external dependency."""
+    msg = str(exc).lower()
+    for dep in deps:
+        if dep in msg:
+            pytest.skip(f"{dep} not available: {exc}")
@@ -0,0 +1,189 @@
+"""Tests for agent construction helpers."""
+
+import pytest
+
+
+@pytest.fixture
+def agent_config(monkeypatch):
+    """Configuration with test credentials for every provider."""
+    monkeypatch.setenv("AWS_REGION", "us-east-1")
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "test-key")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "test-secret")
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "test-key")
+    monkeypatch.setenv("GOOGLE_API_KEY", "test-key")
+    monkeypatch.setenv("CONTRAST_HOST_NAME", "test.contrastsecurity.com")
+    monkeypatch.setenv("CONTRAST_API_KEY", "test-api-key")
+    monkeypatch.setenv("CONTRAST_SERVICE_KEY", "test-service-key")
+    monkeypatch.setenv("CONTRAST_USERNAME", "test@test.com")
+    monkeypatch.setenv("CONTRAST_ORG_ID", "test-org")
+
+    def _make(provider: str):
+        monkeypatch.setenv("LLM_PROVIDER", provider)
+        from app_identifier.config import Config
+        return Config()
+
+    return _make
+
+
+@pytest.fixture(autouse=True)
+def contrast_org(monkeypatch):
+    """Stub the Contrast preflight with an organization of several apps."""
+    from app_identifier import agent
+
+    applications = [
+        {"app_id": "app-1", "name": "first-app"},
+        {"app_id": "app-2", "name": "second-app"},
+    ]
+
+    async def preflight_contrast(config):
+        return applications
+
+    monkeypatch.setattr(agent, "preflight_contrast", preflight_contrast)
+    return applications
+
+
+def test_static_instructions_have_no_placeholders():
+    """Test that the cacheable system prompt does not vary per repository."""
+    from app_identifier.agent import AGENT_INSTRUCTIONS_STATIC
+
+    assert "{" not in AGENT_INSTRUCTIONS_STATIC
+
+
+@pytest.mark.parametrize("provider", ["anthropic", "bedrock"])
+def test_model_settings_enable_prompt_cache(agent_config, provider):
+    """Test that Anthropic and Bedrock get explicit cache breakpoints."""
+    from app_identifier.agent import _build_model_settings
+
+    settings = _build_model_settings(agent_config(provider))
+
+    assert settings[f"{provider}_cache_instructions"] is True
+    assert settings[f"{provider}_cache_tool_definitions"] is True
+
+
+def test_model_settings_empty_for_implicit_cache_providers(agent_config):
+    """Test that providers with implicit caching get no cache settings."""
+    from app_identifier.agent import _build_model_settings
+
+    assert _build_model_settings(agent_config("gemini")) == {}
+
+
+def test_identify_application_applies_usage_limits():
+    """Test that agent runs are bounded by the request and tool call caps."""
+    from app_identifier import agent
+
+    assert "MAX_MODEL_REQUESTS" in agent.identify_application.__code__.co_names
+    assert "MAX_TOOL_CALLS" in agent.identify_application.__code__.co_names
+
+
+def test_result_cache_key_depends_on_contrast_org(agent_config, monkeypatch, tmp_path):
+    """Test that cached app IDs are not shared between organizations."""
+    from app_identifier.agent import _result_cache_key
+
+    key = _result_cache_key(agent_config("anthropic"), str(tmp_path))
+    monkeypatch.setenv("CONTRAST_ORG_ID", "other-org")
+    other_org = _result_cache_key(agent_config("anthropic"), str(tmp_path))
+    monkeypatch.setenv("CONTRAST_HOST_NAME", "eval.contrastsecurity.com")
+    other_host = _result_cache_key(agent_config("anthropic"), str(tmp_path))
+
+    assert len({key, other_org, other_host}) == 3
+
+
+async def test_identify_application_returns_structured_output(agent_config, monkeypatch, tmp_path):
+    """Test that the agent run produces an ApplicationMatch."""
+    from pydantic_ai.models.test import TestModel
+    from app_identifier import agent
+    from app_identifier.models import ApplicationMatch
+
+    async def no_toolsets(config, repo_path):
+        return []
+
+    monkeypatch.setenv("CACHE_TTL", "0")
+    monkeypatch.setattr(agent, "get_model", lambda config: TestModel())
+    monkeypatch.setattr(agent, "create_mcp_toolsets", no_toolsets)
+
+    match, usage = await agent.identify_application(agent_config("anthropic"), str(tmp_path))
+
+    assert isinstance(match, ApplicationMatch)
+    assert usage.input_tokens > 0
+    assert usage.output_tokens > 0
+
+
+async def test_identify_application_uses_declared_app_name(agent_config, monkeypatch, tmp_path):
+    """Test that a name from contrast_security.yaml skips the agent."""
+    from app_identifier import agent
+
+    (tmp_path / "contrast_security.yaml").write_text("application:\n  name: billing-service\n")
+
+    async def find_applications(config, name):
+        return [
+            {"app_id": "other-uuid", "name": "billing-service-v1"},
+            {"app_id": "app-uuid", "name": "Billing-Service", "language": "Java"},
+        ]
+
+    def no_model(config):
+        raise AssertionError("agent should not run")
+
+    monkeypatch.setenv("CACHE_TTL", "0")
+    monkeypatch.setattr(agent, "find_applications", find_applications)
+    monkeypatch.setattr(agent, "get_model", no_model)
+
+    match, usage = await agent.identify_application(agent_config("anthropic"), str(tmp_path))
+
+    assert usage is None
+    assert match.application_id == "app-uuid"
+    assert match.confidence == "HIGH"
+    assert match.metadata["source"] == "contrast_security.yaml"
+
+
+async def test_direct_match_requires_unambiguous_name(agent_config, monkeypatch, tmp_path):
+    """Test that the fast path defers to the agent without an exact match."""
+    from app_identifier import agent
+
+    (tmp_path / "package.json").write_text('{"name": "test-app"}')
+
+    async def find_applications(config, name):
+        return [{"app_id": "app-uuid", "name": "test-app-legacy"}]
+
+    monkeypatch.setattr(agent, "find_applications", find_applications)
+
+    assert await agent._try_direct_config_match(agent_config("anthropic"), str(tmp_path)) is None
+
+
+async def test_identify_application_accepts_prebuilt_model(agent_config, monkeypatch, tmp_path):
+    """Test that callers can supply the model and toolsets themselves."""
+    from pydantic_ai.models.test import TestModel
+    from app_identifier import agent
+
+    def no_model(config):
+        raise AssertionError("model should not be created")
+
+    monkeypatch.setenv("CACHE_TTL", "0")
+    monkeypatch.setattr(agent, "get_model", no_model)
+
+    match, usage = await agent.identify_application(
+        agent_config("gemini"), str(tmp_path), model=TestModel(), toolsets=[]
+    )
+
+    assert match is not None
+
+
+@pytest.mark.parametrize("count", [0, 1])
+async def test_preflight_skips_agent_for_trivial_org(agent_config, contrast_org, monkeypatch, tmp_path, count):
+    """Test that organizations with zero or one application skip the agent."""
+    from app_identifier import agent
+
+    def no_model(config):
+        raise AssertionError("agent should not run")
+
+    del contrast_org[count:]
+    monkeypatch.setenv("CACHE_TTL", "0")
+    monkeypatch.setattr(agent, "get_model", no_model)
+
+    match, usage = await agent.identify_application(agent_config("anthropic"), str(tmp_path))
+
+    assert usage is None
+    if count == 0:
+        assert match is None
+    else:
+        assert match.application_id == "app-1"
+        assert match.confidence == "MEDIUM"
@@ -0,0 +1,81 @@
+"""Tests for the on-disk result cache."""
+
+import os
+import time
+
+import pytest
+from app_identifier.cache import ResultCache, fingerprint_repository
+from app_identifier.models import ApplicationMatch
+
+
+@pytest.fixture
+def match():
+    """Sample application match."""
+    return ApplicationMatch(
+        application_id="test-uuid",
+        application_name="test-app",
+        confidence="HIGH",
+        reasoning="Test",
+        metadata={"language": "Node"},
+    )
+
+
+def test_cache_round_trip(tmp_path, match):
+    """Test that a stored match is returned on the next lookup."""
+    cache = ResultCache(str(tmp_path / "cache"), ttl=60)
+
+    assert cache.get("key") is None
+    cache.set("key", match)
+
+    assert cache.get("key") == match
+
+
+def test_cache_entry_expires(tmp_path, match):
+    """Test that expired entries are treated as misses."""
+    cache = ResultCache(str(tmp_path), ttl=-1)
+    cache.set("key", match)
+
+    assert cache.get("key") is None
+    assert not (tmp_path / "key.json").exists()
+
+
+def test_cache_ignores_corrupt_entries(tmp_path):
+    """Test that unreadable entries are treated as misses."""
+    (tmp_path / "key.json").write_text("not json")
+    cache = ResultCache(str(tmp_path), ttl=60)
+
+    assert cache.get("key") is None
+
+
+def test_cache_evicts_least_recently_used(tmp_path, match):
+    """Test that the oldest entries are evicted beyond max_entries."""
+    cache = ResultCache(str(tmp_path), ttl=60, max_entries=2)
+    cache.set("old", match)
+    cache.set("new", match)
+
+    past = time.time() - 100
+    os.utime(tmp_path / "old.json", (past, past))
+    cache.set("newest", match)
+
+    assert cache.get("old") is None
+    assert cache.get("new") == match
+    assert cache.get("newest") == match
+
+
+def test_fingerprint_changes_with_repository_files(tmp_path):
+    """Test that editing an identifying file changes the fingerprint."""
+    package_json = tmp_path / "package.json"
+    package_json.write_text('{"name": "test-app"}')
+    before = fingerprint_repository(str(tmp_path))
+
+    package_json.write_text('{"name": "renamed-app"}')
+
+    assert fingerprint_repository(str(tmp_path)) != before
+
+
+def test_fingerprint_differs_between_repositories(tmp_path):
+    """Test that repositories without identifying files do not collide."""
+    (tmp_path / "a").mkdir()
+    (tmp_path / "b").mkdir()
+
+    assert fingerprint_repository(str(tmp_path / "a")) != fingerprint_repository(str(tmp_path / "b"))
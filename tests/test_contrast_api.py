@@ -0,0 +1,96 @@
+"""Tests for the direct Contrast REST API client."""
+
+import httpx
+import pytest
+
+
+@pytest.fixture
+def api_config(monkeypatch):
+    """Configuration with test Contrast credentials."""
+    monkeypatch.setenv("LLM_PROVIDER", "bedrock")
+    monkeypatch.setenv("AWS_REGION", "us-east-1")
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "test-key")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "test-secret")
+    monkeypatch.setenv("CONTRAST_HOST_NAME", "test.contrastsecurity.com")
+    monkeypatch.setenv("CONTRAST_API_KEY", "test-api-key")
+    monkeypatch.setenv("CONTRAST_SERVICE_KEY", "test-service-key")
+    monkeypatch.setenv("CONTRAST_USERNAME", "test@test.com")
+    monkeypatch.setenv("CONTRAST_ORG_ID", "test-org")
+
+    from app_identifier.config import Config
+    return Config()
+
+
+@pytest.fixture
+def api_response():
+    """JSON body returned by the mocked Contrast API; tests may replace it."""
+    return {
+        "json": {
+            "success": True,
+            "applications": [{"app_id": "app-uuid", "name": "test-app"}],
+        },
+    }
+
+
+@pytest.fixture
+def requests_made(monkeypatch, api_response):
+    """Route Contrast API requests to a mock transport and record them."""
+    from app_identifier import contrast_api
+
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(200, json=api_response["json"])
+
+    real_client = httpx.AsyncClient
+    monkeypatch.setattr(
+        contrast_api.httpx,
+        "AsyncClient",
+        lambda **kwargs: real_client(transport=httpx.MockTransport(handler), **kwargs),
+    )
+    monkeypatch.setattr(contrast_api, "_preflight_cache", {})
+    return requests
+
+
+async def test_find_applications(api_config, requests_made):
+    """Test that application search is authenticated and filtered by name."""
+    from app_identifier.contrast_api import find_applications
+
+    applications = await find_applications(api_config, "test-app")
+
+    assert applications == [{"app_id": "app-uuid", "name": "test-app"}]
+    request = requests_made[0]
+    assert request.url.path == "/Contrast/api/ng/test-org/applications/filter"
+    assert request.url.params["filterText"] == "test-app"
+    assert request.headers["API-Key"] == "test-api-key"
+    assert request.headers["Authorization"] == "dGVzdEB0ZXN0LmNvbTp0ZXN0LXNlcnZpY2Uta2V5"
+
+
+async def test_preflight_results_are_cached(api_config, requests_made):
+    """Test that repeated preflights within the TTL make a single request."""
+    from app_identifier.contrast_api import preflight_contrast
+
+    first = await preflight_contrast(api_config)
+    second = await preflight_contrast(api_config)
+
+    assert first == second == [{"app_id": "app-uuid", "name": "test-app"}]
+    assert len(requests_made) == 1
+
+
+@pytest.mark.parametrize("body", [
+    {"success": False, "messages": ["Authorization failure"]},
+    {"success": True},
+    {"applications": "test-app"},
+    ["test-app"],
+])
+async def test_unexpected_response_raises(api_config, api_response, requests_made, body):
+    """Test that a body that is not an application listing is not read as an empty org."""
+    from app_identifier.contrast_api import find_applications, preflight_contrast
+
+    api_response["json"] = body
+
+    with pytest.raises(ValueError, match="Unexpected Contrast API response"):
+        await find_applications(api_config, "test-app")
+    with pytest.raises(ValueError, match="Unexpected Contrast API response"):
+        await preflight_contrast(api_config)
@@ -1,20 +1,25 @@
 """Integration tests for MCP server connections."""
 
-import os
+import shutil
 import pytest
+import pytest_asyncio
 import asyncio
 from pathlib import Path
 
+from .helpers import skip_if_missing_dep
+
 
 # Skip integration tests by default if dependencies unavailable
 pytestmark = pytest.mark.asyncio
 
+_HAS_NPX = shutil.which("npx") is not None
+_HAS_DOCKER = shutil.which("docker") is not None
+
 
-@pytest.fixture
-def test_repo_path(tmp_path):
-    """Create a temporary test repository."""
-    repo = tmp_path / "test_repo"
-    repo.mkdir()
+@pytest.fixture(scope="session")
+def test_repo_path(tmp_path_factory):
+    """Create a temporary test repository, shared by the session (read-only)."""
+    repo = tmp_path_factory.mktemp("test_repo")
 
     # Create a simple package.json for testing
     package_json = repo / "package.json"
@@ -23,137 +28,101 @@ def test_repo_path(tmp_path):
     return str(repo)
 
 
-@pytest.fixture
-def mock_config(monkeypatch):
-    """Mock configuration with test credentials."""
-    # Set minimal required env vars
-    monkeypatch.setenv("LLM_PROVIDER", "bedrock")
-    monkeypatch.setenv("AWS_REGION", "us-east-1")
-    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "test-key")
-    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "test-secret")
-    monkeypatch.setenv("CONTRAST_HOST_NAME", "test.contrastsecurity.com")
-    monkeypatch.setenv("CONTRAST_API_KEY", "test-api-key")
-    monkeypatch.setenv("CONTRAST_SERVICE_KEY", "test-service-key")
-    monkeypatch.setenv("CONTRAST_USERNAME", "test@test.com")
-    monkeypatch.setenv("CONTRAST_ORG_ID", "test-org")
-
-    from app_identifier.config import Config
-    return Config()
+@pytest.fixture(scope="session")
+def mock_config():
+    """Mock configuration with test credentials, shared by the session."""
+    with pytest.MonkeyPatch.context() as mp:
+        # Set minimal required env vars
+        mp.setenv("LLM_PROVIDER", "bedrock")
+        mp.setenv("AWS_REGION", "us-east-1")
+        mp.setenv("AWS_ACCESS_KEY_ID", "test-key")
+        mp.setenv("AWS_SECRET_ACCESS_KEY", "test-secret")
+        mp.setenv("CONTRAST_HOST_NAME", "test.contrastsecurity.com")
+        mp.setenv("CONTRAST_API_KEY", "test-api-key")
+        mp.setenv("CONTRAST_SERVICE_KEY", "test-service-key")
+        mp.setenv("CONTRAST_USERNAME", "test@test.com")
+        mp.setenv("CONTRAST_ORG_ID", "test-org")
+
+        from app_identifier.config import Config
+        config = Config()
+
+    # Environment restored before other test modules run
+    return config
+
+
+@pytest_asyncio.fixture(scope="class", loop_scope="class")
+async def fs_servers(mock_config, test_repo_path):
+    """MCP servers for the filesystem tests, created once per class."""
+    if not _HAS_NPX:
+        pytest.skip("npx not available")
+
+    from app_identifier.mcp_tools import create_mcp_toolsets
+
+    try:
+        return await asyncio.wait_for(
+            create_mcp_toolsets(mock_config, test_repo_path),
+            timeout=30.0
+        )
+    except asyncio.TimeoutError:
+        pytest.skip("MCP server connection timed out (may need network)")
+    except Exception as e:
+        skip_if_missing_dep(e)
+        raise
+
+
+@pytest_asyncio.fixture(scope="class", loop_scope="class")
+async def contrast_servers(mock_config, test_repo_path):
+    """MCP servers for the Contrast tests, created once per class."""
+    if not _HAS_DOCKER:
+        pytest.skip("Docker not available")
+
+    from app_identifier.mcp_tools import create_mcp_toolsets
+
+    try:
+        return await asyncio.wait_for(
+            create_mcp_toolsets(mock_config, test_repo_path),
+            timeout=60.0  # Docker pull may take time
+        )
+    except asyncio.TimeoutError:
+        pytest.skip("Contrast MCP connection timed out (may need Docker pull)")
+    except Exception as e:
+        skip_if_missing_dep(e)
+        raise
 
 
 class TestFilesystemMCPIntegration:
     """Tests for filesystem MCP server integration."""
 
-    @pytest.mark.skipif(
-        os.system("which npx > /dev/null 2>&1") != 0,
-        reason="npx not available"
-    )
-    async def test_filesystem_mcp_connection(self, mock_config, test_repo_path):
+    async def test_filesystem_mcp_connection(self, fs_servers):
         """Test that filesystem MCP server can be started and connected."""
-        from app_identifier.mcp_tools import create_mcp_toolsets
+        # Verify we got toolsets
+        assert len(fs_servers) >= 1, "Should have at least filesystem toolset"
 
-        try:
-            toolsets = await asyncio.wait_for(
-                create_mcp_toolsets(mock_config, test_repo_path),
-                timeout=30.0
-            )
-
-            # Verify we got toolsets
-            assert len(toolsets) >= 1, "Should have at least filesystem toolset"
-
-        except asyncio.TimeoutError:
-            pytest.skip("MCP server connection timed out (may need network)")
-        except Exception as e:
-            if "Docker" in str(e) or "docker" in str(e):
-                pytest.skip(f"Docker not available: {e}")
-            else:
-                raise
-
-    @pytest.mark.skipif(
-        os.system("which npx > /dev/null 2>&1") != 0,
-        reason="npx not available"
-    )
-    async def test_filesystem_tools_discovery(self, mock_config, test_repo_path):
+    async def test_filesystem_tools_discovery(self, fs_servers):
         """Test that filesystem MCP server is properly configured."""
-        from app_identifier.mcp_tools import create_mcp_toolsets
+        fs_server = fs_servers[0]
 
-        try:
-            servers = await asyncio.wait_for(
-                create_mcp_toolsets(mock_config, test_repo_path),
-                timeout=30.0
-            )
-
-            fs_server = servers[0]
-
-            # Verify it's an MCP server instance
-            assert hasattr(fs_server, 'tool_prefix'), "Should have tool_prefix attribute"
-            assert fs_server.tool_prefix == "fs_", f"Expected 'fs_' prefix, got {fs_server.tool_prefix}"
-
-        except asyncio.TimeoutError:
-            pytest.skip("Server creation timed out")
-        except Exception as e:
-            if "Docker" in str(e) or "docker" in str(e):
-                pytest.skip(f"Docker not available: {e}")
-            else:
-                raise
+        # Verify it's an MCP server instance
+        assert hasattr(fs_server, 'tool_prefix'), "Should have tool_prefix attribute"
+        assert fs_server.tool_prefix == "fs_", f"Expected 'fs_' prefix, got {fs_server.tool_prefix}"
 
 
 class TestContrastMCPIntegration:
     """Tests for Contrast MCP server integration."""
 
-    @pytest.mark.skipif(
-        os.system("which docker > /dev/null 2>&1") != 0,
-        reason="Docker not available"
-    )
-    async def test_contrast_mcp_connection(self, mock_config, test_repo_path):
+    async def test_contrast_mcp_connection(self, contrast_servers):
         """Test that Contrast MCP server can be started via Docker."""
-        from app_identifier.mcp_tools import create_mcp_toolsets
+        # Verify we got both toolsets
+        assert len(contrast_servers) == 2, "Should have filesystem and contrast toolsets"
 
-        try:
-            toolsets = await asyncio.wait_for(
-                create_mcp_toolsets(mock_config, test_repo_path),
-                timeout=60.0  # Docker pull may take time
-            )
-
-            # Verify we got both toolsets
-            assert len(toolsets) == 2, "Should have filesystem and contrast toolsets"
-
-        except asyncio.TimeoutError:
-            pytest.skip("Contrast MCP connection timed out (may need Docker pull)")
-        except Exception as e:
-            if "Docker" in str(e) or "docker daemon" in str(e).lower():
-                pytest.skip(f"Docker not running: {e}")
-            else:
-                raise
-
-    @pytest.mark.skipif(
-        os.system("which docker > /dev/null 2>&1") != 0,
-        reason="Docker not available"
-    )
-    async def test_contrast_tools_discovery(self, mock_config, test_repo_path):
+    async def test_contrast_tools_discovery(self, contrast_servers):
         """Test that Contrast MCP server is properly configured."""
-        from app_identifier.mcp_tools import create_mcp_toolsets
-
-        try:
-            servers = await asyncio.wait_for(
-                create_mcp_toolsets(mock_config, test_repo_path),
-                timeout=60.0
-            )
-
-            contrast_server = servers[1]
-
-            # Verify it's an MCP server instance
-            assert hasattr(contrast_server, 'tool_prefix'), "Should have tool_prefix attribute"
-            assert contrast_server.tool_prefix == "contrast_", \
-                f"Expected 'contrast_' prefix, got {contrast_server.tool_prefix}"
+        contrast_server = contrast_servers[1]
 
-        except asyncio.TimeoutError:
-            pytest.skip("Contrast server creation timed out")
-        except Exception as e:
-            if "Docker" in str(e) or "docker daemon" in str(e).lower():
-                pytest.skip(f"Docker not running: {e}")
-            else:
-                raise
+        # Verify it's an MCP server instance
+        assert hasattr(contrast_server, 'tool_prefix'), "Should have tool_prefix attribute"
+        assert contrast_server.tool_prefix == "contrast_", \
+            f"Expected 'contrast_' prefix, got {contrast_server.tool_prefix}"
 
 
 class TestMCPToolsetIntegration:
@@ -171,6 +140,17 @@ class TestMCPToolsetIntegration:
 
         assert env["CONTRAST_HOST_NAME"] == "test.contrastsecurity.com"
 
+    async def test_contrast_subprocess_env_is_shared(self, mock_config, test_repo_path):
+        """Test that the Contrast server environment is computed once per config."""
+        from app_identifier.mcp_tools import create_mcp_toolsets
+
+        first = await create_mcp_toolsets(mock_config, test_repo_path)
+        second = await create_mcp_toolsets(mock_config, test_repo_path)
+
+        assert first[1].env is second[1].env
+        assert first[1].env["CONTRAST_ORG_ID"] == "test-org"
+        assert "PATH" in first[1].env
+
     async def test_mcp_timeout_configuration(self, mock_config):
         """Test that MCP connection timeouts are properly configured."""
         # Config should have reasonable timeout
@@ -193,3 +173,57 @@ class TestMCPMockIntegration:
         assert len(servers) == 2, "Should create filesystem and contrast servers"
         assert servers[0].tool_prefix == "fs_"
         assert servers[1].tool_prefix == "contrast_"
+
+    async def test_run_mcp_servers_starts_servers_concurrently(self, mock_config, test_repo_path, monkeypatch):
+        """Test that both servers start without waiting on each other and stop afterwards."""
+        from pydantic_ai.mcp import MCPServerStdio
+        from app_identifier.mcp_tools import create_mcp_toolsets, run_mcp_servers
+
+        both_entering = asyncio.Event()
+        entering = []
+        exited = []
+
+        async def fake_enter(self):
+            entering.append(self.tool_prefix)
+            if len(entering) == 2:
+                both_entering.set()
+            await asyncio.wait_for(both_entering.wait(), timeout=5.0)
+            return self
+
+        async def fake_exit(self, *args):
+            exited.append(self.tool_prefix)
+
+        monkeypatch.setattr(MCPServerStdio, "__aenter__", fake_enter)
+        monkeypatch.setattr(MCPServerStdio, "__aexit__", fake_exit)
+
+        servers = await create_mcp_toolsets(mock_config, test_repo_path)
+        async with run_mcp_servers(servers) as running:
+            assert [s.tool_prefix for s in running] == ["fs_", "contrast_"]
+            assert exited == []
+
+        assert sorted(exited) == ["contrast_", "fs_"]
+
+    async def test_run_mcp_servers_stops_started_server_on_failure(self, mock_config, test_repo_path, monkeypatch):
+        """Test that a failed server start stops the servers that did start."""
+        from pydantic_ai.mcp import MCPServerStdio
+        from app_identifier.mcp_tools import create_mcp_toolsets, run_mcp_servers
+
+        exited = []
+
+        async def fake_enter(self):
+            if self.tool_prefix == "contrast_":
+                raise RuntimeError("docker daemon not running")
+            return self
+
+        async def fake_exit(self, *args):
+            exited.append(self.tool_prefix)
+
+        monkeypatch.setattr(MCPServerStdio, "__aenter__", fake_enter)
+        monkeypatch.setattr(MCPServerStdio, "__aexit__", fake_exit)
+
+        servers = await create_mcp_toolsets(mock_config, test_repo_path)
+        with pytest.raises(RuntimeError, match="docker daemon"):
+            async with run_mcp_servers(servers):
+                pass
+
+        assert exited == ["fs_"]
@@ -1,7 +1,7 @@
 """Tests for output models."""
 
 import pytest
-from app_identifier.models import ApplicationMatch, IdentificationResult
+from app_identifier.models import ApplicationMatch, IdentificationResult, UsageInfo
 
 
 def test_application_match_serialization():
@@ -21,7 +21,8 @@ def test_application_match_serialization():
 
 def test_identification_result_with_match():
     """Test IdentificationResult with successful match."""
-    match = ApplicationMatch(
+    # Validation is covered by test_application_match_serialization
+    match = ApplicationMatch.model_construct(
         application_id="test-uuid",
         application_name="test-app",
         confidence="HIGH",
@@ -29,7 +30,7 @@ def test_identification_result_with_match():
         metadata={},
     )
 
-    result = IdentificationResult(
+    result = IdentificationResult.model_construct(
         success=True,
         repository_path="/test/path",
         match=match,
@@ -43,7 +44,7 @@ def test_identification_result_with_match():
 
 def test_identification_result_no_match():
     """Test IdentificationResult with no match."""
-    result = IdentificationResult(
+    result = IdentificationResult.model_construct(
         success=False,
         repository_path="/test/path",
         error="No match found",
@@ -53,3 +54,17 @@ def test_identification_result_no_match():
     assert not result.success
     assert result.match is None
     assert result.error == "No match found"
+
+
+def test_identification_result_with_usage():
+    """Test IdentificationResult reports cached token usage."""
+    result = IdentificationResult(
+        success=False,
+        repository_path="/test/path",
+        execution_time_ms=1234.56,
+        usage=UsageInfo(input_tokens=1000, output_tokens=200, cache_read_tokens=800),
+    )
+
+    data = result.model_dump()
+    assert data["usage"]["cache_read_tokens"] == 800
+    assert data["usage"]["cache_creation_tokens"] == 0
@@ -0,0 +1,88 @@
+"""Tests for LLM provider selection."""
+
+from types import SimpleNamespace
+
+import pytest
+
+
+def test_get_model_rejects_unknown_provider():
+    """Test that an unknown provider raises a helpful error."""
+    from app_identifier.providers import get_model
+
+    with pytest.raises(ValueError, match="Unknown provider: invalid"):
+        get_model(SimpleNamespace(llm_provider="Invalid"))
+
+
+def test_get_model_dispatches_by_provider(monkeypatch):
+    """Test that get_model calls the factory registered for the provider."""
+    from app_identifier import providers
+
+    config = SimpleNamespace(llm_provider="Gemini")
+    monkeypatch.setitem(providers._PROVIDERS, "gemini", lambda c: ("gemini-model", c))
+
+    assert providers.get_model(config) == ("gemini-model", config)
+
+
+def test_get_model_reuses_model_for_same_settings():
+    """Test that identical configurations share one model instance."""
+    from app_identifier.providers import get_model
+
+    def bedrock_config(model_id):
+        return SimpleNamespace(
+            llm_provider="bedrock",
+            bedrock_model_id=model_id,
+            aws_region="us-east-1",
+            aws_access_key_id="test-key",
+            aws_secret_access_key="test-secret",
+            aws_session_token=None,
+        )
+
+    first = get_model(bedrock_config("anthropic.claude-sonnet-4-5-20250929-v1:0"))
+    second = get_model(bedrock_config("anthropic.claude-sonnet-4-5-20250929-v1:0"))
+    other = get_model(bedrock_config("anthropic.claude-haiku-4-5-20251001-v1:0"))
+
+    assert first is second
+    assert other is not first
+
+
+def test_bedrock_client_uses_configured_region_and_credentials(monkeypatch):
+    """Test that the Bedrock client is built from the config, not the environment."""
+    from app_identifier.providers import get_model
+
+    monkeypatch.setenv("AWS_DEFAULT_REGION", "us-west-2")
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "env-key")
+
+    model = get_model(SimpleNamespace(
+        llm_provider="bedrock",
+        bedrock_model_id="anthropic.claude-sonnet-4-5-20250929-v1:0",
+        aws_region="eu-west-1",
+        aws_access_key_id="config-key",
+        aws_secret_access_key="config-secret",
+        aws_session_token=None,
+    ))
+
+    credentials = model.client._request_signer._credentials
+    assert model.client.meta.region_name == "eu-west-1"
+    assert credentials.access_key == "config-key"
+    assert credentials.secret_key == "config-secret"
+
+
+def test_bedrock_client_uses_session_token(monkeypatch):
+    """Test that temporary credentials keep their session token."""
+    from app_identifier.config import Config
+    from app_identifier.providers import get_model
+
+    monkeypatch.setenv("LLM_PROVIDER", "bedrock")
+    monkeypatch.setenv("AWS_REGION", "us-east-1")
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "temp-key")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "temp-secret")
+    monkeypatch.setenv("AWS_SESSION_TOKEN", "temp-token")
+    monkeypatch.setenv("CONTRAST_HOST_NAME", "test.contrastsecurity.com")
+    monkeypatch.setenv("CONTRAST_API_KEY", "test-api-key")
+    monkeypatch.setenv("CONTRAST_SERVICE_KEY", "test-service-key")
+    monkeypatch.setenv("CONTRAST_USERNAME", "test@test.com")
+    monkeypatch.setenv("CONTRAST_ORG_ID", "test-org")
+
+    model = get_model(Config())
+
+    assert model.client._request_signer._credentials.token == "temp-token"
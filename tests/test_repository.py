@@ -0,0 +1,62 @@
+"""Tests for direct extraction of repository identifiers."""
+
+from app_identifier.repository import detect_language, read_contrast_app_name, read_project_name
+
+
+def test_read_contrast_app_name(tmp_path):
+    """Test that application.name is read from contrast_security.yaml."""
+    (tmp_path / "contrast_security.yaml").write_text(
+        "api:\n  url: https://example.com\napplication:\n  name: billing-service\n"
+    )
+
+    assert read_contrast_app_name(str(tmp_path)) == ("billing-service", "contrast_security.yaml")
+
+
+def test_read_contrast_app_name_missing(tmp_path):
+    """Test that configs without application.name are ignored."""
+    (tmp_path / "contrast.yaml").write_text("api:\n  url: https://example.com\n")
+
+    assert read_contrast_app_name(str(tmp_path)) is None
+
+
+def test_read_contrast_app_name_skips_undecodable_config(tmp_path):
+    """Test that a non-UTF-8 config is skipped in favour of the next one."""
+    (tmp_path / "contrast_security.yaml").write_bytes("application:\n  name: caf\xe9\n".encode("latin-1"))
+    (tmp_path / "contrast.yaml").write_text("application:\n  name: billing-service\n")
+
+    assert read_contrast_app_name(str(tmp_path)) == ("billing-service", "contrast.yaml")
+
+
+def test_read_project_name_from_package_json(tmp_path):
+    """Test that the project name is read from package.json."""
+    (tmp_path / "package.json").write_text('{"name": "test-app", "version": "1.0.0"}')
+
+    assert read_project_name(str(tmp_path)) == ("test-app", "package.json")
+
+
+def test_read_project_name_from_pom(tmp_path):
+    """Test that the project's own artifactId is read from pom.xml."""
+    (tmp_path / "pom.xml").write_text(
+        '<project xmlns="http://maven.apache.org/POM/4.0.0">'
+        "<parent><artifactId>parent-pom</artifactId></parent>"
+        "<artifactId>mcp-contrast</artifactId>"
+        "</project>"
+    )
+
+    assert read_project_name(str(tmp_path)) == ("mcp-contrast", "pom.xml")
+
+
+def test_read_project_name_missing(tmp_path):
+    """Test that repositories without manifests yield no name."""
+    assert read_project_name(str(tmp_path)) is None
+
+
+def test_detect_language(tmp_path):
+    """Test that the primary language is detected from build files."""
+    assert detect_language(str(tmp_path)) is None
+
+    (tmp_path / "package.json").write_text("{}")
+    assert detect_language(str(tmp_path)) == "Node"
+
+    (tmp_path / "pom.xml").write_text("<project/>")
+    assert detect_language(str(tmp_path)) == "Java"
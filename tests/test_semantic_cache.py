@@ -0,0 +1,85 @@
+"""Tests for the identity-keyed semantic cache."""
+
+import pytest
+from app_identifier.models import ApplicationMatch
+from app_identifier.semantic_cache import SemanticCache
+
+
+ORGANIZATION = ("test.contrastsecurity.com", "test-org")
+
+
+def make_repo(path, name, manifest="package.json"):
+    """Create a repository declaring the given Contrast application name."""
+    path.mkdir()
+    (path / "contrast_security.yaml").write_text(f"application:\n  name: {name}\n")
+    if manifest == "package.json":
+        (path / "package.json").write_text('{"name": "api"}')
+    else:
+        (path / "pom.xml").write_text("<project><artifactId>api</artifactId></project>")
+    return str(path)
+
+
+@pytest.fixture
+def match():
+    """Sample confident match."""
+    return ApplicationMatch(
+        application_id="test-uuid",
+        application_name="test-app",
+        confidence="HIGH",
+        reasoning="Exact name match.",
+        metadata={},
+    )
+
+
+def test_match_shared_between_repositories(tmp_path, match):
+    """Test that repositories with the same identity share a match."""
+    cache = SemanticCache(str(tmp_path / "cache"), ORGANIZATION)
+    first = make_repo(tmp_path / "first", "test-app")
+    second = make_repo(tmp_path / "second", "Test-App")
+
+    cache.set(first, match)
+    cached = cache.get(second)
+
+    assert cached.application_id == "test-uuid"
+    assert first in cached.reasoning
+
+
+def test_different_language_is_a_miss(tmp_path, match):
+    """Test that the same name in a different technology stack is not shared."""
+    cache = SemanticCache(str(tmp_path / "cache"), ORGANIZATION)
+    cache.set(make_repo(tmp_path / "node", "test-app"), match)
+
+    assert cache.get(make_repo(tmp_path / "java", "test-app", manifest="pom.xml")) is None
+
+
+def test_different_organization_is_a_miss(tmp_path, match):
+    """Test that application IDs are not shared between organizations."""
+    repo = make_repo(tmp_path / "repo", "test-app")
+    SemanticCache(str(tmp_path / "cache"), ORGANIZATION).set(repo, match)
+
+    other = SemanticCache(str(tmp_path / "cache"), (ORGANIZATION[0], "other-org"))
+
+    assert other.get(repo) is None
+
+
+def test_manifest_name_alone_not_shared(tmp_path, match):
+    """Test that generic package.json names do not link unrelated repositories."""
+    cache = SemanticCache(str(tmp_path / "cache"), ORGANIZATION)
+    first, second = tmp_path / "first", tmp_path / "second"
+    for repo in (first, second):
+        repo.mkdir()
+        (repo / "package.json").write_text('{"name": "api"}')
+
+    cache.set(str(first), match)
+
+    assert cache.get(str(second)) is None
+
+
+def test_low_confidence_match_not_shared(tmp_path, match):
+    """Test that weak matches are not reused for other repositories."""
+    cache = SemanticCache(str(tmp_path / "cache"), ORGANIZATION)
+    repo = make_repo(tmp_path / "repo", "test-app")
+
+    cache.set(repo, match.model_copy(update={"confidence": "LOW"}))
+
+    assert cache.get(repo) is None